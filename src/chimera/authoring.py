@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 
@@ -12,6 +14,8 @@ class Player:
     Game methods that will return instances of this class.
     """
 
+    __slots__ = ("game", "name", "id")
+
     game: Game
     name: str
     id: Optional[int]
@@ -39,13 +43,28 @@ class Game(ABC):
     integer identifier, numbered from 0 (e.g., in a four-player game,
     the players' identifiers would be 0, 1, 2, 3). Currently,
     these identifiers are set in the order in which players join a match.
+
+    Subclasses must also define two integer class attributes:
+
+    - min_players: the minimum number of players in the game. A game
+      cannot start until at least these many players have joined a match.
+    - max_players: the maximum number of players in the game. The backend
+      will not allow more than these many players to join a match.
     """
 
+    __slots__ = ("_game_options", "_players", "_players_by_name",
+                 "_current_player_id", "_state_updated", "_state_event")
+
     _game_options: dict
     _players: List[Player]
-    _players_by_name: Dict[str, Player]
+    _players_by_name: Optional[Dict[str, Player]]
     _current_player_id: int
     _state_updated: bool
+    _state_event: asyncio.Event
+
+    # Must be set by subclasses (see class docstring)
+    min_players: int
+    max_players: int
 
     def __init__(self, game_options: dict):
         """ Constructor
@@ -54,31 +73,21 @@ class Game(ABC):
 
         Args:
             game_options: Dictionary with game-specific options.
+
+        Raises:
+            TypeError: if the subclass does not define min_players
+              and max_players
         """
+        cls = type(self)
+        if not hasattr(cls, "min_players") or not hasattr(cls, "max_players"):
+            raise TypeError(f"{cls.__name__} must define min_players and max_players")
+
         self._game_options = game_options
         self._players = []
-        self._players_by_name = {}
+        # Built on demand by get_player_by_name
+        self._players_by_name = None
         self._state_updated = False
-
-    @property
-    @abstractmethod
-    def min_players(self) -> int:
-        """Returns the minimum number of players in the game
-
-        A game cannot start until at least these many players
-        have joined a match.
-        """
-        raise NotImplementedError
-
-    @property
-    @abstractmethod
-    def max_players(self) -> int:
-        """Returns the maximum number of players in the game
-
-        The backend will not allow more than these many players
-        to join a match.
-        """
-        raise NotImplementedError
+        self._state_event = asyncio.Event()
 
     @property
     @abstractmethod
@@ -143,12 +152,43 @@ class Game(ABC):
         Returns: Player object with the given identifier
 
         """
-        if player_id < 0:
+        if not 0 <= player_id < len(self._players):
             raise ValueError(f"Invalid player_id: {player_id}")
+        return self._players[player_id]
+
+    def get_player_by_name(self, name: str) -> Player:
+        """ Gets the Player object with the given name
+
+        Args:
+            name: Player's name
+
+        Raises:
+            ValueError: if there is no player with that name
+
+        Returns: Player object with the given name
+
+        """
+        if self._players_by_name is None:
+            self._players_by_name = {p.name: p for p in self._players}
         try:
-            return self._players[player_id]
-        except IndexError:
-            raise ValueError(f"Invalid player_id: {player_id}")
+            return self._players_by_name[name]
+        except KeyError:
+            raise ValueError(f"Invalid player name: {name}")
+
+    def _get_player_fast(self, player_id: int) -> Player:
+        """ Gets the Player object whose identifier is player_id,
+        without validating the identifier
+
+        Only for use with identifiers that are known to be valid
+        (e.g., ids of players that are already in the game).
+
+        Args:
+            player_id: Player identifier
+
+        Returns: Player object with the given identifier
+
+        """
+        return self._players[player_id]
 
     def notify_update(self) -> None:
         """
@@ -160,6 +200,7 @@ class Game(ABC):
 
         """
         self._state_updated = True
+        self._state_event.set()
 
     # PRIVATE METHODS
     #
@@ -186,31 +227,42 @@ class Game(ABC):
         """
         self._players.append(player)
         player.id = len(self._players) - 1
-        self._players_by_name[player.name] = player
+        # get_player_by_name will rebuild it with the new player
+        self._players_by_name = None
 
     def _reset_state_updated(self) -> None:
         """Resets the updated state flag"""
         self._state_updated = False
+        self._state_event.clear()
+
+    async def _wait_for_update(self) -> None:
+        """ Waits until notify_update() is called
+
+        Lets the backend push the game's state to the players
+        when it changes, instead of polling game_state. Returns
+        immediately if there is an update that hasn't been
+        reset with _reset_state_updated() yet.
+
+        Returns: None
+        """
+        await self._state_event.wait()
 
 
 class TwoPlayerGame(Game, ABC):
     """Convenience class for two-player games
 
-    Only implements the min_players and max_players methods,
+    Only sets the min_players and max_players attributes,
     to require exactly two players. Leaves all other
     abstract methods from Game unimplemented.
     """
 
-    def __init__(self, game_options):
-        super().__init__(game_options)
+    __slots__ = ()
 
-    @property
-    def min_players(self):
-        return 2
+    min_players = 2
+    max_players = 2
 
-    @property
-    def max_players(self):
-        return 2
+    def __init__(self, game_options):
+        super().__init__(game_options)
 
 
 class TurnBasedGame(Game, ABC):
@@ -227,6 +279,9 @@ class TurnBasedGame(Game, ABC):
     querying and enforcing these turns.
     """
 
+    # _current_player_id is already a slot in Game
+    __slots__ = ()
+
     _current_player_id: int
 
     def __init__(self, game_options: dict):
@@ -266,18 +321,15 @@ class TwoPlayerTurnBasedGame(TurnBasedGame, ABC):
 
     """Convenience class for turn-based two-player games
 
-    Only implements the min_players and max_players methods,
+    Only sets the min_players and max_players attributes,
     to require exactly two players. Leaves all other
     abstract methods from TurnBasedGame unimplemented.
     """
 
-    def __init__(self, game_options):
-        super().__init__(game_options)
+    __slots__ = ()
 
-    @property
-    def min_players(self):
-        return 2
+    min_players = 2
+    max_players = 2
 
-    @property
-    def max_players(self):
-        return 2
+    def __init__(self, game_options):
+        super().__init__(game_options)
@@ -0,0 +1,39 @@
+# Numba-compiled round resolution, used by RockPaperScissors.resolve_batch()
+#
+# Only imported from inside resolve_batch(), since importing numba
+# is slow and it is only needed when simulating lots of rounds at once
+
+import numpy as np
+
+from numba import njit
+
+
+@njit(cache=True)
+def resolve_batch(p1_ids, p2_ids, beats_mask, mask_width):
+    """
+    resolves many rounds at once
+
+    Inputs:
+        p1_ids, p2_ids: int64 arrays of `Move.id`s, one entry per round
+        beats_mask: the subgame's packed mask, from get_beats_mask_for_game()
+        mask_width: number of bits per move in beats_mask
+
+    Outputs:
+        int8 array with one entry per round:
+            0 if player 1 won, 1 if player 2 won, -1 for a tie
+    """
+    n = p1_ids.shape[0]
+    winners = np.empty(n, dtype=np.int8)
+
+    for i in range(n):
+        p1_id = p1_ids[i]
+        p2_id = p2_ids[i]
+
+        if (beats_mask >> (p1_id * mask_width + p2_id)) & 1:
+            winners[i] = 0
+        elif (beats_mask >> (p2_id * mask_width + p1_id)) & 1:
+            winners[i] = 1
+        else:
+            winners[i] = -1
+
+    return winners
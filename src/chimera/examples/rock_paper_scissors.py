@@ -2,7 +2,10 @@
 # inside of itself. This postpones type evaluation
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set, Tuple, Union
+import sys
+
+from functools import lru_cache
+from typing import AbstractSet, Callable, Dict, List, Optional, Sequence, Tuple
 
 # for some reason, importing as chimera.authoring didn't work
 from ..authoring import TwoPlayerGame, Player
@@ -26,6 +29,66 @@ RPSLS_RULES="""
             Spock smashes scissors
             """
 
+def _build_rps() -> List[Move]:
+    """
+    builds the moves for classic rock paper scissors
+    """
+    # create moves
+    rock = Move("rock")
+    paper = Move("paper")
+    scissors = Move("scissors")
+
+    # add relationships
+    rock.add_beats(scissors)
+    paper.add_beats(rock)
+    scissors.add_beats(paper)
+
+    return [rock,paper,scissors]
+
+def _build_rpsls() -> List[Move]:
+    """
+    builds the moves for rock paper scissors lizard spock
+    (see RPSLS_RULES)
+    """
+    # create moves
+    rock = Move("rock")
+    paper = Move("paper")
+    scissors = Move("scissors")
+    lizard = Move("lizard")
+    spock = Move("spock")
+
+    # add relationships
+    # TODO add support for flavor text (Lizard "poisons" Spock)
+
+    # rock
+    rock.add_beats(scissors)
+    rock.add_beats(lizard)
+
+    # scissors
+    scissors.add_beats(paper)
+    scissors.add_beats(lizard)
+
+    # paper
+    paper.add_beats(rock)
+    paper.add_beats(spock)
+
+    # lizard
+    lizard.add_beats(spock)
+    lizard.add_beats(paper)
+
+    # spock
+    spock.add_beats(rock)
+    spock.add_beats(scissors)
+
+    return [rock,paper,scissors,lizard,spock]
+
+# builder function for each accepted subgame_id
+_BUILDERS: Dict[str,Callable[[],List[Move]]] = {
+        "rps" : _build_rps,
+        "rpsls" : _build_rpsls
+        }
+
+@lru_cache(maxsize=None)
 def get_move_dict_for_game(subgame_id:str) -> Dict[str,Move]:
     """
     function to return the Move set 
@@ -47,69 +110,130 @@ def get_move_dict_for_game(subgame_id:str) -> Dict[str,Move]:
     Output:
         Dictionary of all allowable moves for the game
         with each Move having their `Move.moves_i_beat` set filled in
+        (and frozen, so add_beats() can't be used on them anymore)
+        and `Move.id` set to its position in the subgame (0, 1, 2, ...)
+        and `Move.subgame_id` set to subgame_id
+        and `Move.beats_mask` set from `Move.moves_i_beat`
 
         stored as : {
                 "move_name" : Move
                 }
+
+        results are cached per subgame_id, so every game of the same
+        variant shares the same dictionary and Move objects.
+        None of them should be modified after they're returned
+    """
+
+    builder = _BUILDERS.get(subgame_id)
+
+    if builder is None:
+        # TODO, change this to instead be an InvalidGameOptions error 
+        # if we decide to make that exist
+        raise exc.IncorrectActionData(details=f"provided RPS-subgame id: {subgame_id} which is not either RPS or RPSLS")
+
+    moves = builder()
+
+    # the relationships are done, and the moves will be shared
+    # between games, so don't let them change from here on
+    for move_id, move in enumerate(moves):
+        move.id = move_id
+        move.subgame_id = subgame_id
+        move.moves_i_beat = frozenset(move.moves_i_beat)
+
+    # needs every move's id, so only once they're all set
+    for move in moves:
+        move.beats_mask = sum(1 << beaten_move.id for beaten_move in move.moves_i_beat)
+
+    # transform list into dictionary to return
+    return {move.name:move for move in moves}
+
+# outcomes stored in the table returned by get_outcome_table_for_game(),
+# from the point of view of the first move in the pair
+WIN = 1
+LOSE = -1
+TIE = 0
+
+@lru_cache(maxsize=None)
+def get_outcome_table_for_game(subgame_id:str) -> Dict[Tuple[str,str],int]:
+    """
+    function to return the outcome of every possible pair of moves
+    for any rock paper scissors like game
+
+    built once per subgame_id from the moves in get_move_dict_for_game()
+    so resolving a round is a single dictionary lookup
+
+    Input:
+        subgame_id: the id for the variety of RPS, 
+            same as for get_move_dict_for_game()
+
+    Output:
+        Dictionary with an entry for every ordered pair of move names
+
+        stored as : {
+                ("move_a_name", "move_b_name") : WIN, LOSE or TIE
+                }
+
+        where WIN means move a beats move b
     """
+    moves = get_move_dict_for_game(subgame_id)
 
-    returned_move_set: Set[Move] = set()
-    match subgame_id:
-        case "rps":
-            # create moves
-            rock = Move("rock")
-            paper = Move("paper")
-            scissors = Move("scissors")
+    # anything not filled in below is a tie
+    # (the diagonal, and moves that don't beat each other)
+    outcome_table = {(a, b): TIE for a in moves for b in moves}
 
-            # add relationships
-            rock.add_beats(scissors)
-            paper.add_beats(rock)
-            scissors.add_beats(paper)
+    for move in moves.values():
+        for beaten_move in move.moves_i_beat:
+            outcome_table[(move.name, beaten_move.name)] = WIN
+            outcome_table[(beaten_move.name, move.name)] = LOSE
 
-            returned_move_set = {rock,paper,scissors}
+    return outcome_table
 
-        case "rpsls":
-            # create moves
-            rock = Move("rock")
-            paper = Move("paper")
-            scissors = Move("scissors")
-            lizard = Move("lizard")
-            spock = Move("spock")
+@lru_cache(maxsize=None)
+def get_outcome_matrix_for_game(subgame_id:str) -> Tuple[Tuple[int,...],...]:
+    """
+    same outcomes as get_outcome_table_for_game(), but indexed
+    by `Move.id` instead of by move name
 
-            # add relationships
-            # TODO add support for flavor text (Lizard "poisons" Spock)
+    Input:
+        subgame_id: the id for the variety of RPS, 
+            same as for get_move_dict_for_game()
 
-            # rock
-            rock.add_beats(scissors)
-            rock.add_beats(lizard)
+    Output:
+        outcome_matrix where outcome_matrix[move_a.id][move_b.id]
+        is WIN, LOSE or TIE, from move a's point of view
+    """
+    moves = get_move_dict_for_game(subgame_id)
+    outcome_table = get_outcome_table_for_game(subgame_id)
 
-            # scissors
-            scissors.add_beats(paper)
-            scissors.add_beats(lizard)
+    # moves are in id order (see get_move_dict_for_game())
+    names = list(moves)
+    return tuple(tuple(outcome_table[(a, b)] for b in names) for a in names)
 
-            # paper
-            paper.add_beats(rock)
-            paper.add_beats(spock)
+# number of bits per move in the mask returned by get_beats_mask_for_game()
+# so subgames can have up to 8 moves
+BEATS_MASK_WIDTH = 8
 
-            # lizard
-            lizard.add_beats(spock)
-            lizard.add_beats(paper)
+@lru_cache(maxsize=None)
+def get_beats_mask_for_game(subgame_id:str) -> int:
+    """
+    packs every move's `Move.beats_mask` for a subgame into a single int
 
-            # spock
-            spock.add_beats(rock)
-            spock.add_beats(scissors)
+    Input:
+        subgame_id: the id for the variety of RPS, 
+            same as for get_move_dict_for_game()
 
-            returned_move_set = {rock,paper,scissors,lizard,spock}
+    Output:
+        beats_mask where move a beats move b if
+        (beats_mask >> (a.id * BEATS_MASK_WIDTH + b.id)) & 1
+    """
+    moves = get_move_dict_for_game(subgame_id)
+    assert len(moves) <= BEATS_MASK_WIDTH
 
-        case _:
-            # TODO, change this to instead be an InvalidGameOptions error 
-            # if we decide to make that exist
-            raise exc.IncorrectActionData(details=f"provided RPS-subgame id: {subgame_id} which is not either RPS or RPSLS")
+    beats_mask = 0
+    for move in moves.values():
+        beats_mask |= move.beats_mask << (move.id * BEATS_MASK_WIDTH)
 
-    # return whatever move set has been constructed
-    # transform set into dictionary to return
-    return_dict = {move.name:move for move in returned_move_set}
-    return return_dict
+    return beats_mask
 
 class Move:
     """
@@ -118,25 +242,48 @@ class Move:
 
     generalized to be used regardless of game
     """
+    __slots__ = ("name", "moves_i_beat", "id", "subgame_id", "beats_mask", "_str_cache")
+
     name: str
-    moves_i_beat: Set[Move]
+    # a set while the game's moves are being built, a frozenset after
+    moves_i_beat: AbstractSet[Move]
+    id: Optional[int]
+    subgame_id: Optional[str]
+    beats_mask: Optional[int]
+    _str_cache: Optional[str]
+
     def __init__(self,name:str) -> None:
         """
         Inputs:
             name: the name of the move, 
                 eg: "rock", "lizard", "john"
         """
-        self.name = name
+        # interned, move names are used as keys all over
+        # (move dicts, outcome tables, game_state)
+        self.name = sys.intern(name)
         self.moves_i_beat = set()
 
+        # position of the move in its subgame, set by get_move_dict_for_game()
+        self.id = None
+
+        # the subgame the move was built for, also set by get_move_dict_for_game()
+        self.subgame_id = None
+
+        # bit (1 << move.id) is set for every move in moves_i_beat
+        # also set by get_move_dict_for_game()
+        self.beats_mask = None
+
+        # string built by __str__, reset whenever moves_i_beat changes
+        self._str_cache = None
+
     def __str__(self) -> str:
-        header = ""
-        name = self.name.upper().rjust(10) 
-        joiner = " beats: "
-        beats = "[" + ", ".join([str(move.name).ljust(8) for move in self.moves_i_beat]) + "]"
+        # moves_i_beat doesn't change once the game is set up
+        # so only build the string the first time
+        if self._str_cache is None:
+            beats = ", ".join(f"{move.name:<8}" for move in self.moves_i_beat)
+            self._str_cache = f"{self.name.upper():>10} beats: [{beats}]"
 
-        return_string = header + name + joiner + beats
-        return return_string
+        return self._str_cache
 
     def add_beats(self,Move) -> None:
         """
@@ -148,7 +295,10 @@ class Move:
         Outputs:
             nothing
         """
+        # only while building, see get_move_dict_for_game()
+        assert isinstance(self.moves_i_beat, set)
         self.moves_i_beat.add(Move)
+        self._str_cache = None
 
     def beats(self,opponent_move:Move) -> bool:
         """
@@ -160,8 +310,25 @@ class Move:
         Output:
             True if the this move beats the opponents
             False otherwise (or the the provided `opponent_move` is anything besides a Move)
+
+        uses beats_mask when both moves come from the same subgame's
+        get_move_dict_for_game(), since ids are only unique within a subgame
         """
-        return opponent_move in self.moves_i_beat
+        if not isinstance(opponent_move, Move):
+            return False
+
+        # moves from another subgame, or that weren't set up by
+        # get_move_dict_for_game(), can't be compared by id
+        if self.subgame_id is None or opponent_move.subgame_id != self.subgame_id:
+            return opponent_move in self.moves_i_beat
+
+        return bool((self.beats_mask >> opponent_move.id) & 1)
+
+
+# placeholder in RockPaperScissors.current_round_moves for a player
+# who hasn't moved yet this round. Named "None" so it reports
+# the same way an empty move always has in game_state
+_NO_MOVE = Move(str(None))
 
 
 class RockPaperScissors(TwoPlayerGame):
@@ -177,6 +344,12 @@ class RockPaperScissors(TwoPlayerGame):
             "rpsls" :  "rock paper scissors lizard spock"
             }
 
+    __slots__ = ("points", "current_round_moves",
+                 "current_round_winner_id", "points_to_win", "subgame_id",
+                 "outcome_matrix", "_player_names", "_game_type_dict",
+                 "_history_dicts", "_max_points", "_build_state",
+                 "_moves_played", "_initial_move_dict")
+
     def __init__(self, game_options=dict()):
         # game_options is, if not specified, the empty dictionary
         super().__init__(game_options) 
@@ -186,17 +359,15 @@ class RockPaperScissors(TwoPlayerGame):
         # id's are assigned in ascending order from 0 as players join
         self.points: Optional[List[int]] = None
 
-        # move history per round, stored as a list of lists
-        # add a move by doing:
-        # self.history.append(
-        #         [player1 Move, player2 Move, Player who won the round (or None)]
-        #         )
-        self.history: Optional[List[List[Union[Move,Optional[Player]]]]]= None
-
         # simply a list where [0] is the first players move this round
         # can be indexed by player.id because 
         # id's are assigned in ascending order from 0 as players join
-        self.current_round_moves: Optional[List[Optional[Move]]] = None
+        # players who haven't moved yet this round have _NO_MOVE
+        self.current_round_moves: Optional[List[Move]] = None
+
+        # bitmask of who has moved this round,
+        # bit (1 << player.id) is set once that player has moved
+        self._moves_played: int = 0
 
         # ID of the winning player for the current round, if completed.
         # None in the case of a Tie, and if the round is in progress
@@ -214,8 +385,40 @@ class RockPaperScissors(TwoPlayerGame):
         # self.subgame_id: str = "rpsls"
         self.subgame_id: str = "rps"
 
-        self.valid_moves: Dict[str,Move] = get_move_dict_for_game(self.subgame_id)
+        # raises if the subgame_id is not valid
+        self.outcome_matrix: Tuple[Tuple[int,...],...] = get_outcome_matrix_for_game(self.subgame_id)
+
+        # highest score out of self.points, used by self.done
+        # kept up to date by process_current_round()
+        self._max_points: int = 0
+
+        # player names can't change once the game has started,
+        # so on_start() looks them up once instead of on every game_state read
+        self._player_names: Optional[List[str]] = None
 
+        # "moves" dict for a round where nobody has moved yet
+        self._initial_move_dict: Optional[Dict[str,str]] = None
+
+        # game_type dict for game_state, the subgame is fixed when the game is created
+        self._game_type_dict: Optional[Dict[str,str]] = None
+
+        # move history per round, oldest first, already in the
+        # game_state format (one dict per completed round)
+        # appended to by process_current_round()
+        self._history_dicts: Optional[List[dict]] = None
+
+        # builds game_state, specialized for this match's players
+        # by make_state_builder() in on_start()
+        self._build_state: Optional[Callable[[], dict]] = None
+
+    @property
+    def valid_moves(self) -> Dict[str,Move]:
+        """
+        returns all the allowable moves for this game's subgame,
+        stored as {"move_name" : Move}
+        """
+        # cached, every game of the same subgame shares the same dict
+        return get_move_dict_for_game(self.subgame_id)
 
     @property
     def game_state(self):
@@ -249,34 +452,9 @@ class RockPaperScissors(TwoPlayerGame):
                         ]
                 }
         """
-        state = {}
-
-        # assert for type checking that the game has started 
-        # and the initial None values are gone
-        assert self.history is not None
-        assert self.points is not None
-        assert self.current_round_moves is not None
-
-        players = [self.get_player_by_id(0),self.get_player_by_id(1)] 
-        player_names = [player.name for player in players]
-
-        # first game type
-        game_type_dict = self.get_game_type_for_game_state()
-        state["game_type"] = game_type_dict
-
-        # now round
-        current_round = self.get_current_round_for_game_state(player_names= player_names)
-        state["current_round"] = current_round
-
-        # now points
-        points = self.get_points_for_game_state(player_names= player_names)
-        state["points"] = points
-
-        # now history
-        history_list = self.get_history_list_for_game_state(player_names=player_names)
-        state["history"] = history_list
-
-        return state
+        # set by on_start(), there's no state to report before the game starts
+        assert self._build_state is not None, "game_state read before on_start()"
+        return self._build_state()
 
     @property
     def done(self) -> bool:
@@ -285,27 +463,20 @@ class RockPaperScissors(TwoPlayerGame):
 
         for RPS, this means that one player has reached the point threshold to win
         """
-        threshold = self.points_to_win
-
-        # assert for type checking, 
-        # done should not be called before `on_start()` which instantiates self.points
-        assert self.points is not None
-        # this check should be sufficient as `self.done` should be checked after every move
-        # and since points start at 0 and can only be incremented by 1
-        # checking at every change should means this is enough
-
-        return threshold in self.points
+        # self._max_points is kept up to date by process_current_round()
+        # so there's no need to look through self.points
+        return self._max_points >= self.points_to_win
 
     @property
     def winner(self):
         if self.done:
-            # there must be points at this point
-            assert self.points
+            # there must be points at this point, done is only True after on_start()
+            p1_points, p2_points = self.points
 
-            if self.points[0] > self.points[1]:
-                return self.get_player_by_id(0)
-            elif self.points[0] < self.points[1]:
-                return self.get_player_by_id(1)
+            if p1_points > p2_points:
+                return self._get_player_fast(0)
+            elif p1_points < p2_points:
+                return self._get_player_fast(1)
             else:
                 return None
         else:
@@ -313,9 +484,27 @@ class RockPaperScissors(TwoPlayerGame):
 
         
     def on_start(self):
+        # everything below (and game_state, winner, play_move()
+        # and process_current_round()) assumes players 0 and 1 both exist
+        assert self.num_players == self.max_players, \
+            f"RockPaperScissors started with {self.num_players} players, needs {self.max_players}"
+
         self.points = [0] * self.max_players
-        self.history = []
-        self.current_round_moves = [None,None]
+        self._max_points = 0
+        self.current_round_moves = [_NO_MOVE,_NO_MOVE]
+        self._moves_played = 0
+
+        self._player_names = [self.get_player_by_id(0).name,
+                              self.get_player_by_id(1).name]
+        self._initial_move_dict = {
+                self._player_names[0]: _NO_MOVE.name,
+                self._player_names[1]: _NO_MOVE.name
+                }
+        self._game_type_dict = self.get_game_type_for_game_state()
+        self._history_dicts = []
+
+        # needs the player names and self._history_dicts from above
+        self._build_state = self.make_state_builder()
 
         # don't actually notify update since that 
         # is currently designed to only happen when 
@@ -325,7 +514,6 @@ class RockPaperScissors(TwoPlayerGame):
     def on_end(self):
         pass
 
-
     def action_move(self,player: Player,data: str):
         """
         method called when a player sends a "move" game-action request 
@@ -338,7 +526,8 @@ class RockPaperScissors(TwoPlayerGame):
             player: Player object corresponding to the player making a move
 
             data: the "data" field of the params. 
-                    I specify this to be either "Rock", "Paper", or "Scissors"
+                    I specify this to be the name of one of the subgame's moves,
+                    e.g. "Rock", "Paper", or "Scissors" (case doesn't matter)
 
                     considering adding another field for an incompleted move or disconnect
 
@@ -416,33 +605,33 @@ class RockPaperScissors(TwoPlayerGame):
             process it and notify update
         """
         player_id = player.id
-        assert self.current_round_moves is not None
+        # players get their id when they're added to the game
         assert player_id is not None
         
         # check if player can move
 
-        recorded_player_move = self.current_round_moves[player_id]
-        if recorded_player_move is not None:
+        player_bit = 1 << player_id
+        if self._moves_played & player_bit:
+            recorded_player_move = self.current_round_moves[player_id]
             raise exc.NotPlayerTurn(
                     details=f"you already have made a move this round : {recorded_player_move}")
 
         else:
             # no recorded move for player this round
+            self._moves_played |= player_bit
             self.current_round_moves[player_id] = player_move
-            recorded_move = self.current_round_moves[player_id]
-            assert isinstance(recorded_move,Move)
             
             if not self.current_round_over:
                 # if the rounds not over after making the move
                 # then we're still waiting on the other player
-                return recorded_move.name
+                return player_move.name
 
             else:
                 # round is over!
                 self.process_current_round()    
                 self.notify_update()
                 self.reset_for_next_round()
-                return recorded_move.name
+                return player_move.name
             
 
             
@@ -456,9 +645,10 @@ class RockPaperScissors(TwoPlayerGame):
 
         Outputs: 
             nothing, only updating attributes 
-            .current_round_moves and .current_round_winner_id
+            .current_round_moves, ._moves_played and .current_round_winner_id
         """
-        self.current_round_moves = [None,None]
+        self.current_round_moves = [_NO_MOVE,_NO_MOVE]
+        self._moves_played = 0
         self.current_round_winner_id = None
 
     def process_current_round(self):
@@ -469,9 +659,6 @@ class RockPaperScissors(TwoPlayerGame):
         updates the history,
         """
         assert self.current_round_over
-        assert self.current_round_moves is not None
-        assert self.history is not None
-        assert self.points is not None
 
         # determine outcome
         winning_player: Optional[Player] = self.get_round_winner()
@@ -482,15 +669,22 @@ class RockPaperScissors(TwoPlayerGame):
             assert winning_player_id is not None 
 
             self.points[winning_player_id] += 1
+            if self.points[winning_player_id] > self._max_points:
+                self._max_points = self.points[winning_player_id]
 
         # update the history
-        # self.history.append([p1_move, p2_move, id of player who won the round (or None) ])
-        history_item = [*self.current_round_moves,winning_player]
+        p1_move, p2_move = self.current_round_moves
+        p1_name, p2_name = self._player_names
 
-        # should never be more than 3, two players, one outcome
-        assert len(history_item) == 3
+        winner_name = None
+        if winning_player is not None:
+            winner_name = winning_player.name
 
-        self.history.append(history_item)
+        self._history_dicts.append({
+            "moves" : {p1_name: p1_move.name,
+                       p2_name: p2_move.name},
+            "winner" : winner_name
+            })
 
 
     def get_round_winner(self) -> Optional[Player]:
@@ -511,16 +705,18 @@ class RockPaperScissors(TwoPlayerGame):
 
         move1,move2 = self.current_round_moves
 
+        # outcome from player 1's point of view
+        outcome = self.outcome_matrix[move1.id][move2.id]
 
-        if move1.beats(move2):
+        if outcome == WIN:
             # assign current_round_winner_id so game_state can easily access 
             # the information 
             self.current_round_winner_id = 0
-            return self.get_player_by_id(0)
+            return self._get_player_fast(0)
 
-        elif move2.beats(move1):
+        elif outcome == LOSE:
             self.current_round_winner_id = 1
-            return self.get_player_by_id(1)
+            return self._get_player_fast(1)
         else:
             # neither move beats the other
             return None
@@ -534,19 +730,10 @@ class RockPaperScissors(TwoPlayerGame):
             nothing, will be looking at self.current_round_moves
 
         Outputs:
-            True if both players have made a move (current_round_moves has two moves in it)
+            True if both players have made a move (both bits of _moves_played are set)
             False if at least one player hasn't made a move yet
         """
-        # should never be called before on_start()
-        assert self.current_round_moves is not None
-
-        # is_empty_move = None in self.current_round_moves
-
-        # # if there are no empty moves, then the round is done!
-        # return not is_empty_move
-
-        all_moves = all(isinstance(move,Move) for move in self.current_round_moves)
-        return all_moves
+        return self._moves_played == 0b11
 
     def get_move_from_player_data(self,player_move_string:str):
         """
@@ -559,139 +746,142 @@ class RockPaperScissors(TwoPlayerGame):
 
         Outputs:
             the Move object with the same name as the player_move_string
+            ignoring case (so "Rock" and "rock" are both rock)
 
         Raises:
             IncorrectMove : when the provided move name is not in 
                             this game's valid moves
+                            (including anything that isn't a string)
         """
-        move = self.valid_moves.get(player_move_string)
+        # the data field comes straight from the client, so it might not be a string
+        if not isinstance(player_move_string, str):
+            raise exc.IncorrectMove
+
+        # move names are all lowercase. Not interned: it's client data,
+        # and the dict lookup hashes and compares it either way
+        move_name = player_move_string.lower()
+        move = get_move_dict_for_game(self.subgame_id).get(move_name)
 
         if move is None:
             raise exc.IncorrectMove
         else:
             return move
 
-    def get_game_type_for_game_state(self) -> Dict[str,Dict[str,str]]:
+    def resolve_batch(self, p1_ids: Sequence[int], p2_ids: Sequence[int]) -> List[int]:
         """
-        return the game_type dict as required for game_state
+        resolves many rounds at once, without touching the game's state.
+        Meant for simulations (e.g. bots playing each other) rather than
+        for matches played through the server
 
-        "game_type" : {
-            "id" : "rps" , ID corresponding to the particular subgame
-            "description" : "standard rock paper scissors" description of the subgame
-            }
-        """
-        game_type = {}
-        game_type["id"] = self.subgame_id
-        game_type["description"] = RockPaperScissors.VALID_SUBGAME_IDS[self.subgame_id]
+        uses the numba kernel in _rps_numba.py when numba is installed,
+        with the same results as without it
 
-        return game_type
+        Inputs:
+            p1_ids, p2_ids: the `Move.id`s played by each player,
+                one entry per round (any sequence of ints)
 
-    def get_current_round_for_game_state(self,player_names: List[str]) -> Dict[str,Union[Dict[str,str], str]]:
-        """
-        return the properly formatted current_round dictionary
-        to be used in game_state
+        Outputs:
+            list with one entry per round:
+                0 if player 1 won, 1 if player 2 won, -1 for a tie
 
-        "current_round" : {
-                "moves" : {
-                    "[player_1_name]" : player 1's move,
-                    "[player_2_name]" : player 2's move,
-                    },
-                "winner" : Optional[Player name] (optional in case of a tie)
-                },
+        Raises:
+            ValueError: if the sequences have different lengths,
+                or if any id isn't a move of this game's subgame
+        """
+        if len(p1_ids) != len(p2_ids):
+            raise ValueError(f"got {len(p1_ids)} moves for player 1 "
+                             f"but {len(p2_ids)} for player 2")
+
+        # checked here so both paths below can trust the ids:
+        # negative ids would wrap around in the outcome matrix,
+        # and the numba kernel would shift past the beats mask
+        num_moves = len(self.outcome_matrix)
+        for move_ids in (p1_ids, p2_ids):
+            for move_id in move_ids:
+                if not 0 <= move_id < num_moves:
+                    raise ValueError(f"{move_id} is not a move id for {self.subgame_id}")
+
+        try:
+            # imported here, numba takes a while to import
+            # and isn't needed for regular matches
+            import numpy as np
+            from ._rps_numba import resolve_batch
+        except ImportError:
+            # numba is optional, do the same thing in plain Python
+            winner_ids = {WIN: 0, LOSE: 1, TIE: -1}
+            return [winner_ids[self.outcome_matrix[p1_id][p2_id]]
+                    for p1_id, p2_id in zip(p1_ids, p2_ids)]
+
+        beats_mask = get_beats_mask_for_game(self.subgame_id)
+        # the kernel is compiled for int64 arrays, so lists, tuples
+        # and other int dtypes all go through the same code
+        winners = resolve_batch(np.asarray(p1_ids, dtype=np.int64),
+                                np.asarray(p2_ids, dtype=np.int64),
+                                beats_mask, BEATS_MASK_WIDTH)
+        return winners.tolist()
+
+    def make_state_builder(self) -> Callable[[], dict]:
+        """
+        returns a function that builds the whole game_state dictionary
+        in one go, specialized for the players in this match
+
+        everything that can't change during a match (player names,
+        the game_type dict, the points list, the history list) is looked
+        up once here, so each call only has to read the current round
+        and the scores.
+
+        should only be called after on_start() has set up
+        self.points, self._player_names and self._history_dicts
         """
-
-        assert self.history is not None
         assert self.points is not None
-        assert self.current_round_moves is not None
-
-        current_round = {}
-
-        # construct move dict first
 
-        # if the round is in progress, this will then report None
-        # as the moves haven't happened yet
-        move_dict: Dict[str,str] = {}
-
-        for player_name,player_move in zip(player_names,self.current_round_moves):
-            if player_move is not None:
-                move_dict[player_name] = player_move.name
+        p1_name, p2_name = self._player_names
+        player_names = (p1_name, p2_name)
+        game_type = self._game_type_dict
+        points = self.points
+        history = self._history_dicts
+        initial_move_dict = self._initial_move_dict
+
+        def build_state() -> dict:
+            if not self._moves_played:
+                # nobody has moved yet this round
+                moves = initial_move_dict.copy()
             else:
-                move_dict[player_name] = str(None)
-
-        current_round["moves"] = move_dict
-
-        # next get the winner
-
-        # by default, current winner is None
-        current_round_winner = None
-        if self.current_round_winner_id is not None:
-            # grab the name of the current round's winner
-            current_round_winner = player_names[self.current_round_winner_id]
-
-        # regardless of if the winner is None, add it to the current_round dict
-        current_round["winner"] = current_round_winner
-
-        return current_round
-
-    def get_points_for_game_state(self,player_names: List[str]) -> Dict[str,int]:
-        """
-        return points dictionary for the purposes of reporting game state
-
-        "points" {
-            "[player_1_name]" : player 1's score,
-            "[player_2_name]" : player 2's score,
-            },
-        """
-        assert self.points is not None
-
-        points = {player_name: player_score for player_name,player_score in zip(player_names,self.points)}
+                # current_round_moves is replaced every round, so read it each time
+                # _NO_MOVE is named "None", so no need to check for it
+                p1_move, p2_move = self.current_round_moves
+                moves = {p1_name: p1_move.name, p2_name: p2_move.name}
 
-        return points
+            winner_id = self.current_round_winner_id
 
+            return {
+                # copied, so callers can't change the match's subgame
+                "game_type" : dict(game_type),
+                "current_round" : {
+                    "moves" : moves,
+                    "winner" : player_names[winner_id] if winner_id is not None else None
+                    },
+                "points" : {p1_name: points[0], p2_name: points[1]},
+                # copied, so a state handed out earlier doesn't
+                # pick up rounds that finish after it was built
+                "history" : list(history)
+                }
 
+        return build_state
 
-    def get_history_list_for_game_state(self,player_names: List[str]) -> List[Dict[str,Union[Dict[str,str], str]]]:
+    def get_game_type_for_game_state(self) -> Dict[str,Dict[str,str]]:
         """
-        return the properly formatted list of rounds for the purposes of reporting
-        game state.
+        return the game_type dict as required for game_state
 
-        history[0] is the 1st played round
-        history[-1] is the most recently completed round, where a round has the below format
+        "game_type" : {
+            "id" : "rps" , ID corresponding to the particular subgame
+            "description" : "standard rock paper scissors" description of the subgame
+            }
 
-        "round" : {
-                "moves" : {
-                    "[player_1_name]" : player 1's move,
-                    "[player_2_name]" : player 2's move,
-                    },
-                "winner" : Optional[Player name] (optional in case of a tie)
-                },
+        works at any time, the subgame is fixed in __init__()
+        on_start() keeps the result for game_state to copy
         """
-        # self.history is of the format: 
-        # [p1_move, p2_move, id of player who won the round (or None)]
-
-        history = []
-
-        # assert len(history[0]) == 3
-        assert self.history is not None
-
-        p1_name, p2_name = player_names
-        for p1_move,p2_move,optional_winning_Player in self.history:
-            round = {}
-            moves = {p1_name:p1_move, 
-                     p2_name:p2_move}
-
-            winner_name = None
-            if optional_winning_Player is not None:
-                optional_winning_Player.name
-
-            round["moves"] = moves
-            round["winner"] = winner_name
-
-            history.append(round)
-
-        return history
-
-
-
-
-
+        return {
+                "id" : self.subgame_id,
+                "description" : RockPaperScissors.VALID_SUBGAME_IDS[self.subgame_id]
+                }
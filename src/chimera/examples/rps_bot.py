@@ -0,0 +1,199 @@
+"""
+alpha-beta search for rock paper scissors like games
+
+a single round of RPS is trivially one-ply, so this is a starting
+point for bots that look several rounds ahead (e.g. with a model of
+the opponent's habits). For now the opponent is assumed to see our
+move before picking theirs, which makes the search pessimistic:
+the value of a position is the score difference we can guarantee.
+
+moves really are simultaneous though, so AlphaBetaBot only uses the
+search to rule out moves, and picks at random among the moves that
+are tied for best. In rps and rpsls every move beats as many moves
+as it loses to, so every move ties and the bot plays uniformly at
+random, which is the best (unexploitable) strategy for these games.
+
+the search only works with ints (move ids, points, and the packed
+beats mask from get_beats_mask_for_game()) so it can be JITed later,
+like the batch resolver in _rps_numba.py
+"""
+from __future__ import annotations
+
+import random
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from .rock_paper_scissors import (BEATS_MASK_WIDTH, get_beats_mask_for_game,
+                                  get_move_dict_for_game)
+
+# (my points, opponent points, my move this round or NO_MOVE_ID)
+State = Tuple[int, int, int]
+
+# move id used in a State before we have picked a move for the round
+NO_MOVE_ID = -1
+
+# kinds of values stored in the transposition table
+_EXACT = 0
+_LOWER = 1
+_UPPER = 2
+
+
+def _beats(beats_mask: int, move_id: int, opponent_id: int) -> bool:
+    """
+    returns whether the move with id move_id beats the one with opponent_id
+    """
+    return bool((beats_mask >> (move_id * BEATS_MASK_WIDTH + opponent_id)) & 1)
+
+
+@lru_cache(maxsize=None)
+def _ordered_moves(beats_mask: int, num_moves: int) -> Tuple[int, ...]:
+    """
+    returns all the move ids, with the moves that beat the most
+    other moves first. Searching good moves first lets alpha-beta
+    prune more of the tree
+    """
+    lane = (1 << BEATS_MASK_WIDTH) - 1
+
+    def num_beaten(move_id):
+        return bin((beats_mask >> (move_id * BEATS_MASK_WIDTH)) & lane).count("1")
+
+    return tuple(sorted(range(num_moves), key=num_beaten, reverse=True))
+
+
+def alphabeta(state: State, depth: int, alpha: float, beta: float,
+              maximizing: bool, beats_mask: int, num_moves: int,
+              points_to_win: int,
+              table: Optional[Dict[Tuple[State, int, bool], Tuple[float, int]]] = None) -> float:
+    """
+    alpha-beta search over the next `depth` rounds
+
+    each round is two plies: we pick a move (maximizing),
+    then the opponent picks theirs (minimizing) and the round is scored
+
+    Inputs:
+        state: (my points, opponent points, my move this round)
+            my move is NO_MOVE_ID on maximizing plies
+        depth: number of rounds left to search
+        alpha, beta: the usual alpha-beta window
+            (start with -math.inf, math.inf)
+        maximizing: True if it's our ply
+        beats_mask: packed beats table, from get_beats_mask_for_game()
+        num_moves: number of moves in the subgame
+        points_to_win: points needed to win the game
+        table: transposition table, shared between calls to reuse
+            work across searches. Created if not given
+
+    Outputs:
+        my points minus the opponent's points at the end of the search
+        (or when someone wins, whichever happens first)
+    """
+    if table is None:
+        table = {}
+
+    my_points, opponent_points, my_move = state
+
+    if depth == 0 or my_points >= points_to_win or opponent_points >= points_to_win:
+        return my_points - opponent_points
+
+    key = (state, depth, maximizing)
+    entry = table.get(key)
+    if entry is not None:
+        stored_value, kind = entry
+        if kind == _EXACT:
+            return stored_value
+        if kind == _LOWER and stored_value >= beta:
+            return stored_value
+        if kind == _UPPER and stored_value <= alpha:
+            return stored_value
+
+    original_alpha, original_beta = alpha, beta
+    moves = _ordered_moves(beats_mask, num_moves)
+
+    if maximizing:
+        value = float("-inf")
+        for move_id in moves:
+            child = (my_points, opponent_points, move_id)
+            value = max(value, alphabeta(child, depth, alpha, beta, False,
+                                         beats_mask, num_moves, points_to_win, table))
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+    else:
+        value = float("inf")
+        for opponent_id in moves:
+            # the round is over, score it
+            child_my_points = my_points
+            child_opponent_points = opponent_points
+            if _beats(beats_mask, my_move, opponent_id):
+                child_my_points += 1
+            elif _beats(beats_mask, opponent_id, my_move):
+                child_opponent_points += 1
+
+            child = (child_my_points, child_opponent_points, NO_MOVE_ID)
+            value = min(value, alphabeta(child, depth - 1, alpha, beta, True,
+                                         beats_mask, num_moves, points_to_win, table))
+            beta = min(beta, value)
+            if alpha >= beta:
+                break
+
+    if value <= original_alpha:
+        table[key] = (value, _UPPER)
+    elif value >= original_beta:
+        table[key] = (value, _LOWER)
+    else:
+        table[key] = (value, _EXACT)
+
+    return value
+
+
+class AlphaBetaBot:
+    """
+    bot that picks its moves with alphabeta()
+
+    keeps its transposition table between moves, so
+    later searches reuse the work of earlier ones
+    """
+
+    def __init__(self, subgame_id: str = "rps", depth: int = 3,
+                 points_to_win: int = 3, seed: Optional[int] = None) -> None:
+        """
+        Inputs:
+            subgame_id: the variety of RPS, see get_move_dict_for_game()
+            depth: number of rounds to look ahead
+            points_to_win: points needed to win the game
+            seed: seed for picking between equally good moves
+                (for reproducible games)
+        """
+        self.random = random.Random(seed)
+        self.move_names = list(get_move_dict_for_game(subgame_id))
+        self.beats_mask = get_beats_mask_for_game(subgame_id)
+        self.depth = depth
+        self.points_to_win = points_to_win
+        self.table: Dict[Tuple[State, int, bool], Tuple[float, int]] = {}
+
+    def choose_move(self, my_points: int, opponent_points: int) -> str:
+        """
+        returns the name of the move to play, given the current score
+        (ready to send as the "data" of a "move" game-action)
+
+        picked at random among the moves with the best search value,
+        so the bot can't be beaten by always countering the same move
+        """
+        num_moves = len(self.move_names)
+        best_value = float("-inf")
+        best_move_ids = []
+
+        for move_id in _ordered_moves(self.beats_mask, num_moves):
+            state = (my_points, opponent_points, move_id)
+            # values are whole numbers, so a window starting just below
+            # best_value still gives exact values for moves that tie it
+            value = alphabeta(state, self.depth, best_value - 1, float("inf"), False,
+                              self.beats_mask, num_moves, self.points_to_win, self.table)
+            if value > best_value:
+                best_value = value
+                best_move_ids = [move_id]
+            elif value == best_value:
+                best_move_ids.append(move_id)
+
+        return self.move_names[self.random.choice(best_move_ids)]
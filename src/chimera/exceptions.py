@@ -1,86 +1,64 @@
-import json
-
 from enum import Enum
 
 
 class ErrorCode(Enum):
+    # Each member is (code, message). The code is the member's value,
+    # and the message is what str() returns.
+
     # General error codes
-    PARSE_ERROR = -32700
-    INCORRECT_REQUEST = -32600
-    NO_SUCH_OPERATION = -32601
-    INCORRECT_PARAMS = -32602
+    PARSE_ERROR = (-32700, "Parse error")
+    INCORRECT_REQUEST = (-32600, "Incorrect request")
+    NO_SUCH_OPERATION = (-32601, "No such operation")
+    INCORRECT_PARAMS = (-32602, "Incorrect parameters")
 
     # Operation-specific codes
-    UNKNOWN_GAME = -40100
-    ALREADY_IN_MATCH = -40101
-    UNKNOWN_MATCH = -40102
-    DUPLICATE_PLAYER = -40103
-    INCORRECT_MATCH = -40104
+    UNKNOWN_GAME = (-40100, "Unknown game")
+    ALREADY_IN_MATCH = (-40101, "Already in a match")
+    UNKNOWN_MATCH = (-40102, "Unknown match")
+    DUPLICATE_PLAYER = (-40103, "Duplicate player name")
+    INCORRECT_MATCH = (-40104, "Incorrect match")
 
     # game-action codes
-    GAME_NOT_PLAYER_TURN = -50100
-    GAME_NO_SUCH_ACTION = -50101
-    GAME_INCORRECT_ACTION_DATA = -50102
-    GAME_INCORRECT_MOVE = -50103
+    GAME_NOT_PLAYER_TURN = (-50100, "Action not allowed outside player's turn")
+    GAME_NO_SUCH_ACTION = (-50101, "Unsupported action in game")
+    GAME_INCORRECT_ACTION_DATA = (-50102, "Incorrect data in game action")
+    GAME_INCORRECT_MOVE = (-50103, "Incorrect move")
 
-    def __str__(self):
-        return ERROR_MESSAGES[self.value]
+    def __new__(cls, code, message):
+        obj = object.__new__(cls)
+        obj._value_ = code
+        obj._message = message
+        return obj
 
+    def __str__(self):
+        return self._message
 
-ERROR_MESSAGES = {
-    # General error codes
-    ErrorCode.PARSE_ERROR.value: "Parse error",
-    ErrorCode.INCORRECT_REQUEST.value: "Incorrect request",
-    ErrorCode.NO_SUCH_OPERATION.value: "No such operation",
-    ErrorCode.INCORRECT_PARAMS.value: "Incorrect parameters",
-
-    # Operation-specific codes
-    ErrorCode.UNKNOWN_GAME.value: "Unknown game",
-    ErrorCode.ALREADY_IN_MATCH.value: "Already in a match",
-    ErrorCode.UNKNOWN_MATCH.value: "Unknown match",
-    ErrorCode.DUPLICATE_PLAYER.value: "Duplicate player name",
-    ErrorCode.INCORRECT_MATCH.value: "Incorrect match",
 
-    # game-action codes
-    ErrorCode.GAME_NOT_PLAYER_TURN.value: "Action not allowed outside player's turn",
-    ErrorCode.GAME_NO_SUCH_ACTION.value: "Unsupported action in game",
-    ErrorCode.GAME_INCORRECT_ACTION_DATA.value: "Incorrect data in game action",
-    ErrorCode.GAME_INCORRECT_MOVE.value: "Incorrect move"
-}
+# Kept for code that looks messages up by numeric code
+ERROR_MESSAGES = {code.value: str(code) for code in ErrorCode}
 
 
 
 class ChimeraGameException(Exception):
+    # Details used when none are given when raising
+    default_details = None
 
     def __init__(self, details=None):
+        if details is None:
+            details = self.default_details
         self.details = details
 
 
 class NotPlayerTurn(ChimeraGameException):
-
-    def __init__(self, details=None):
-        if details is None:
-            details = "It is not your turn."
-
-        super().__init__(details)
+    default_details = "It is not your turn."
 
 
 class IncorrectActionData(ChimeraGameException):
-
-    def __init__(self, details=None):
-        if details is None:
-            details = "Incorrect action data"
-
-        super().__init__(details)
+    default_details = "Incorrect action data"
 
 
 class IncorrectMove(ChimeraGameException):
-
-    def __init__(self, details=None):
-        if details is None:
-            details = "Incorrect move"
-
-        super().__init__(details)
+    default_details = "Incorrect move"
 
 
 class ChimeraClientException(Exception):
@@ -109,6 +87,9 @@ class MalformedResponse(ChimeraClientException):
     """
 
     def __init__(self, message, response):
+        # only needed here, and this is rarely raised
+        import json
+
         response_json = json.dumps(response, indent=2)
         exc_message = f"Malformed response: {message}\n\n{response_json}"
         super().__init__(exc_message)
@@ -203,3 +184,38 @@ ERROR_EXCEPTIONS = {
     ErrorCode.GAME_INCORRECT_MOVE.value: GameIncorrectMove
 }
 
+
+
+# ERROR_EXCEPTIONS laid out by offset within each block of codes
+# (e.g., -50100 is offset 0 of the game-action block), so
+# get_error_exception() can index a tuple instead of hashing
+def _exceptions_block(base):
+    # the block holds every ErrorCode from base down to base - 99,
+    # so adding a member to ErrorCode is enough to extend it
+    size = max(base - error.value for error in ErrorCode
+               if base - 100 < error.value <= base) + 1
+    return tuple(ERROR_EXCEPTIONS.get(base - offset, ErrorResponse)
+                 for offset in range(size))
+
+
+_OPERATION_BLOCK_BASE = ErrorCode.UNKNOWN_GAME.value
+_OPERATION_EXCEPTIONS = _exceptions_block(_OPERATION_BLOCK_BASE)
+
+_GAME_BLOCK_BASE = ErrorCode.GAME_NOT_PLAYER_TURN.value
+_GAME_EXCEPTIONS = _exceptions_block(_GAME_BLOCK_BASE)
+
+
+def get_error_exception(code):
+    """
+    Returns the exception class for an error code in a response
+    from the server, or ErrorResponse if there is no specific one
+    """
+    offset = _GAME_BLOCK_BASE - code
+    if 0 <= offset < len(_GAME_EXCEPTIONS):
+        return _GAME_EXCEPTIONS[offset]
+
+    offset = _OPERATION_BLOCK_BASE - code
+    if 0 <= offset < len(_OPERATION_EXCEPTIONS):
+        return _OPERATION_EXCEPTIONS[offset]
+
+    return ErrorResponse